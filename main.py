@@ -1,5 +1,7 @@
 from playwright.async_api import async_playwright
-import pandas as pd
+import csv
+import httpx
+import orjson
 import re
 import emoji
 import logging
@@ -7,7 +9,11 @@ import os
 import asyncio
 import random
 import time
-from typing import List, Dict, Optional, Any
+import xxhash
+from datasketch import LeanMinHash, MinHash, MinHashLSH
+from pybloom_live import ScalableBloomFilter
+from typing import List, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import quote_plus
 from http import HTTPStatus
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import Error as PlaywrightError
@@ -23,74 +29,375 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class RateLimiter:
-    """Simple rate limiter to prevent being blocked"""
-    def __init__(self, min_delay: float = 2.0, max_delay: float = 3.0):
-        self.min_delay = min_delay
-        self.max_delay = max_delay
-        self.last_request_time = 0
+# Number of concurrent hospital workers, each with at most one page open
+MAX_PARALLEL_PAGES = 4
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36'
+
+# Internal JSON endpoint the Maps UI loads reviews from; tried before opening a page
+REVIEWS_ENDPOINT = "https://www.google.com/maps/preview/review/listentitiesreviews"
+
+# Preset Google consent cookies so the consent banner never renders
+CONSENT_COOKIES = [
+    {"name": "CONSENT", "value": "YES+cb.20210328-17-p0.en+FX+000", "domain": ".google.com", "path": "/"},
+    {"name": "SOCS", "value": "CAISHAgBEhJnd3NfMjAyMzA4MDgtMF9SQzIaAmVuIAEaBgiAoJmnBg", "domain": ".google.com", "path": "/"}
+]
+
+# Browser profile kept between runs so Google Maps' HTTP cache and service workers stay warm
+PROFILE_DIR = "./.pw-profile"
+
+# Resource types the scraper never reads; blocking them cuts page weight.
+# Stylesheets stay: the results feed and review panel only scroll as CSS
+# overflow containers, and innerText depends on the rendered layout.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+# Delays in seconds, kept here so they can be tuned (or zeroed in tests) in one place
+SCROLL_SLEEP_MIN = 0.8
+SCROLL_SLEEP_MAX = 1.4
+HOSPITAL_DELAY_MIN = 3.0
+HOSPITAL_DELAY_MAX = 7.0
+
+# Upper bounds in milliseconds for event-driven waits. A scroll whose wait times
+# out loaded nothing new, which ends the scroll loop.
+PAGE_LOAD_TIMEOUT = 10000
+SCROLL_WAIT_TIMEOUT = 3000
+
+# Maximum number of scrolls through a hospital's reviews
+MAX_REVIEW_SCROLLS = 5
+
+# Jaccard similarity above which two reviews of a hospital count as near-duplicates
+NEAR_DUP_THRESHOLD = 0.85
+MINHASH_PERMUTATIONS = 128
+# LSH banding weighted toward few missed duplicates; candidates are confirmed
+# against NEAR_DUP_THRESHOLD, which filters out the extra false positives
+LSH_WEIGHTS = (0.1, 0.9)
+# Length of the character shingles compared between reviews
+SHINGLE_SIZE = 4
+
+# Precompiled patterns used on every review
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\s]+')
+# Place feature id in Google Maps place URLs, e.g. "!1s0x14cab7...:0x7a6d4d..."
+_PLACE_ID_RE = re.compile(r'!1s(0x[0-9a-f]+):(0x[0-9a-f]+)', re.I)
+_ADDR_PREFIX_RE = re.compile(r'^(?:General|Private|University|State) hospital\s*', re.I)
+
+# Column order of the per-hospital review CSV files
+REVIEW_FIELDS = ["Hospital", "Reviewer", "Rating", "Review"]
+
+# Scrolls the window and the search results feed to the bottom
+RESULTS_SCROLL_JS = """
+() => {
+    window.scrollTo(0, document.body.scrollHeight);
+    document.querySelectorAll('div[role="feed"], div[jsaction*="scroll"]').forEach(container => {
+        container.scrollTop = container.scrollHeight;
+    });
+}
+"""
+
+# Runs in the browser over the search result cards; the place link's aria-label
+# doubles as the hospital name when the title element is missing
+EXTRACT_HOSPITALS_JS = """
+(cards) => cards.map(card => {
+    const link = card.querySelector('a.hfpxzc');
+    const title = card.querySelector('div.qBF1Pd');
+    const address = card.querySelector('div.W4Efsd:nth-child(1)');
+    return {
+        name: (title && title.innerText) || (link && link.getAttribute('aria-label')) || '',
+        href: link ? link.getAttribute('href') : '',
+        addressText: address ? address.innerText : ''
+    };
+})
+"""
+
+# Selectors that identify individual review elements, in priority order.
+# The attribute-presence match is cheapest for Chromium, so it goes first and
+# the class-substring scans only run when it finds nothing.
+REVIEW_ELEMENT_SELECTORS = (
+    "div[data-review-id]",         # Elements with review ID
+    "div[class*='jJc9Ad']",        # Original selector
+    "div[class*='review']",        # Classes with 'review'
+    ".review-container",           # Common review container class
+    "div[class*='comment']",       # Comment sections
+    "div:has(span[aria-label*='stars'])" # Elements containing star ratings
+)
 
-    async def wait(self):
-        """Wait a random amount of time between requests"""
-        now = time.time()
-        elapsed = now - self.last_request_time
-        delay = random.uniform(self.min_delay, self.max_delay)
+# Returns the first selector, in priority order, that matches anything, with its
+# match count; all candidates are tried in a single round-trip
+FIND_FIRST_SELECTOR_JS = """
+(selectors) => {
+    for (const selector of selectors) {
+        try {
+            const count = document.querySelectorAll(selector).length;
+            if (count > 0) return [selector, count];
+        } catch (e) {
+            // Skip selectors the browser can't parse
+        }
+    }
+    return null;
+}
+"""
+
+# Matches any review element, for waiting until reviews are on the page
+ANY_REVIEW_SELECTOR = ", ".join(REVIEW_ELEMENT_SELECTORS)
+
+# Elements that might open the reviews section when no Reviews tab is found
+REVIEW_TRIGGER_SELECTORS = (
+    "button:has-text('Reviews')",
+    "button:has-text('Review')",
+    "a:has-text('Reviews')",
+    "div:has-text('Reviews')",
+    "span:has-text('Reviews')"
+)
 
-        if elapsed < delay:
-            wait_time = delay - elapsed
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
-            await asyncio.sleep(wait_time)
+# Fallback selectors for each review field, tried in order
+REVIEWER_SELECTORS = ["div[class*='d4r55']", "div[class*='author']", "span[class*='name']", "div[class*='profile']"]
+RATING_SELECTORS = ["span[aria-label*='star']", "span[class*='rating']", "div[class*='star']", "span[aria-label]"]
+REVIEW_TEXT_SELECTORS = ["span[class*='wiI7pd']", "div[class*='review-text']", "div[class*='content']", "span[class*='review']"]
+
+# Scrolls the window and every likely review container by one step
+REVIEW_SCROLL_JS = """
+(distance) => {
+    window.scrollBy(0, distance);
+    document.querySelectorAll(
+        'div[role="feed"], div[jsaction*="scroll"], div[data-review-id], div[class*="review"], div[class*="scroll"]'
+    ).forEach(container => {
+        container.scrollTop = container.scrollHeight;
+    });
+}
+"""
+
+# Installs a MutationObserver that queues each review element as soon as it
+# appears and clicks its "More" button in the same pass, so truncated text has
+# expanded by the time the scraper drains the queue
+INSTALL_REVIEW_HARVESTER_JS = """
+({selector, reviewerSelectors, ratingSelectors, textSelectors}) => {
+    const firstValue = (el, selectors, read) => {
+        for (const selector of selectors) {
+            const found = el.querySelector(selector);
+            const value = found && read(found);
+            if (value) return value;
+        }
+        return '';
+    };
+    const seen = new WeakSet();
+    const clicked = new WeakSet();
+    const pending = [];
+    const expanding = [];
+    const collect = () => {
+        document.querySelectorAll(selector).forEach(el => {
+            if (seen.has(el)) return;
+            seen.add(el);
+            el.querySelectorAll('button').forEach(button => {
+                if (!clicked.has(button) && button.innerText.trim() === 'More') {
+                    clicked.add(button);
+                    expanding.push(button);
+                    button.click();
+                }
+            });
+            pending.push(el);
+        });
+    };
+    // Ready once reviews are queued and every clicked "More" button has gone away
+    window.__reviewsReady = () => pending.length > 0 &&
+        expanding.every(button => !button.isConnected || button.innerText.trim() !== 'More');
+    window.__drainReviews = () => {
+        expanding.length = 0;
+        return pending.splice(0).map(el => ({
+            reviewer: firstValue(el, reviewerSelectors, node => node.innerText),
+            rating: firstValue(el, ratingSelectors, node => node.getAttribute('aria-label') || node.innerText),
+            // Fall back to the element's whole text as a last resort
+            text: firstValue(el, textSelectors, node => node.innerText) || el.innerText
+        }));
+    };
+    if (window.__reviewObserver) window.__reviewObserver.disconnect();
+    window.__reviewObserver = new MutationObserver(collect);
+    window.__reviewObserver.observe(document.body, {subtree: true, childList: true});
+    collect();
+}
+"""
+
+# True once the harvester has queued reviews whose "More" expansions are done
+REVIEWS_READY_JS = "() => window.__reviewsReady()"
+
+# Runs the whole scroll loop in the page: drains the harvester, scrolls, waits up
+# to `timeout` ms for new reviews and stops on max reviews, max scrolls or a
+# scroll that loaded nothing. Never scrolls if the first drain already has enough,
+# and only returns up to maxReviews.
+SCROLL_AND_COLLECT_REVIEWS_JS = """
+async ({distance, maxReviews, maxScrolls, timeout}) => {
+    const scroll = """ + REVIEW_SCROLL_JS.strip() + """;
+    const waitForReviews = () => new Promise(resolve => {
+        const deadline = Date.now() + timeout;
+        const check = () => {
+            if (window.__reviewsReady() || Date.now() >= deadline) resolve();
+            else setTimeout(check, 100);
+        };
+        check();
+    });
+    const reviews = window.__drainReviews();
+    for (let i = 0; i < maxScrolls && reviews.length < maxReviews; i++) {
+        scroll(distance);
+        await waitForReviews();
+        const batch = window.__drainReviews();
+        if (batch.length === 0) break;
+        reviews.push(...batch);
+    }
+    return reviews.slice(0, maxReviews);
+}
+"""
 
-        self.last_request_time = time.time()
+class RateLimiter:
+    """Token-bucket rate limiter shared by all scrape tasks to prevent being blocked"""
+    def __init__(self, min_delay: float = 2.0, max_delay: float = 3.0, burst: int = 1):
+        # Refill one token per mean delay, holding at most `burst` tokens
+        self._rate = 2 / (min_delay + max_delay)
+        self._capacity = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        # Serializes concurrent callers so the average rate is enforced globally
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        """Wait until a request token is available"""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) / self._rate
+                logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
+                await asyncio.sleep(wait_time)
+                self._tokens = 0
+                self._last_refill = time.monotonic()
+            else:
+                self._tokens -= 1
+
+class Review(NamedTuple):
+    """A scraped review; fields are in REVIEW_FIELDS (CSV column) order"""
+    hospital: str
+    reviewer: str
+    rating: str
+    text: str
 
 class ReviewValidator:
     """Validates and deduplicates review data"""
     def __init__(self):
-        self.seen_reviews = set()
-
-    def validate_review(self, review: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # Fixed-memory set of review hashes; rare false positives only drop a review
+        self.seen_reviews = ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-6)
+        # Per-hospital MinHash index for catching lightly edited duplicates, with
+        # the signatures it holds; an LSH key is the signature's list position
+        self.near_dup_indexes: Dict[str, Tuple[MinHashLSH, List[LeanMinHash]]] = {}
+        # Permutations built once and shared by every MinHash
+        self.permutations = MinHash(num_perm=MINHASH_PERMUTATIONS).permutations
+
+    def is_near_duplicate(self, hospital: str, text: str) -> bool:
+        """Check text against earlier reviews of the hospital, indexing it if new"""
+        # Character shingles over lowercased text without punctuation, so a
+        # trailing "!" or one changed word only touches a few shingles
+        normalized = _WS_RE.sub(' ', _PUNCT_RE.sub('', text.lower())).strip()
+        shingles = {
+            normalized[i:i + SHINGLE_SIZE]
+            for i in range(max(len(normalized) - SHINGLE_SIZE + 1, 1))
+        }
+        minhash = MinHash(num_perm=MINHASH_PERMUTATIONS, permutations=self.permutations)
+        minhash.update_batch([shingle.encode('utf-8') for shingle in shingles])
+
+        if hospital not in self.near_dup_indexes:
+            index = MinHashLSH(threshold=NEAR_DUP_THRESHOLD, num_perm=MINHASH_PERMUTATIONS, weights=LSH_WEIGHTS)
+            self.near_dup_indexes[hospital] = (index, [])
+        index, signatures = self.near_dup_indexes[hospital]
+        for key in index.query(minhash):
+            if minhash.jaccard(signatures[key]) >= NEAR_DUP_THRESHOLD:
+                return True
+
+        # Keep only the hash values; the permutations aren't needed for comparisons
+        signature = LeanMinHash(minhash)
+        index.insert(len(signatures), signature)
+        signatures.append(signature)
+        return False
+
+    def forget_hospital(self, hospital: str):
+        """Release a finished hospital's near-duplicate index and signatures"""
+        self.near_dup_indexes.pop(hospital, None)
+
+    def validate_review(self, review: Review) -> Optional[Review]:
         """Validate review data and return None if invalid"""
         # Check for required fields
-        required_fields = ["Hospital", "Reviewer", "Rating", "Review"]
-        for field in required_fields:
-            if field not in review or not review[field]:
+        for field, value in zip(REVIEW_FIELDS, review):
+            if not value:
                 logger.warning(f"Missing required field: {field}")
                 return None
 
         # Check review text length
-        if len(review["Review"]) < 5:
-            logger.debug(f"Review too short: {review['Review']}")
+        if len(review.text) < 5:
+            logger.debug(f"Review too short: {review.text}")
             return None
 
-        # Deduplicate using a hash of content
-        review_hash = hash(f"{review['Hospital']}:{review['Reviewer']}:{review['Review']}")
-        if review_hash in self.seen_reviews:
-            logger.debug(f"Duplicate review: {review['Review'][:30]}...")
+        # Deduplicate using a fast hash of the review text, seeded per hospital
+        hospital_seed = xxhash.xxh3_64_intdigest(review.hospital.encode('utf-8'))
+        review_hash = xxhash.xxh3_64_intdigest(review.text.encode('utf-8'), seed=hospital_seed)
+        # add() reports whether the hash was (probably) already present
+        if self.seen_reviews.add(review_hash):
+            logger.debug(f"Duplicate review: {review.text[:30]}...")
+            return None
+
+        if self.is_near_duplicate(review.hospital, review.text):
+            logger.debug(f"Near-duplicate review: {review.text[:30]}...")
             return None
 
-        self.seen_reviews.add(review_hash)
         return review
 
+class ReviewsEndpoint:
+    """HTTP client for the Maps reviews endpoint, shared by all workers"""
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        # Cleared by the first non-200 response or unparseable payload so no
+        # worker spends rate limiter tokens on the endpoint again
+        self.enabled = True
+
+    def disable(self, reason: str):
+        """Stop using the endpoint for the rest of the run"""
+        logger.warning(f"{reason}, using the browser from now on")
+        self.enabled = False
+
+async def block_unneeded_resources(route):
+    """Abort requests for resources that don't carry review data"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 async def initialize_browser():
     """Initialize Playwright browser"""
     try:
         playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=False,
-            args=['--disable-blink-features=AutomationControlled']  # Help avoid detection
-        )
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36',
+        context = await playwright.chromium.launch_persistent_context(
+            user_data_dir=PROFILE_DIR,
+            headless=True,
+            args=[
+                '--disable-blink-features=AutomationControlled',  # Help avoid detection
+                '--blink-settings=imagesEnabled=false',
+                # Lower per-tab memory
+                '--disable-gpu',
+                '--disable-dev-shm-usage',
+                '--no-sandbox'
+            ],
+            user_agent=USER_AGENT,
             viewport={'width': 1280, 'height': 800}
         )
+        await context.add_cookies(CONSENT_COOKIES)
+        # Skip images, media and fonts for every page in the context
+        await context.route("**/*", block_unneeded_resources)
         # Add stealth settings to avoid detection
         await context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => false
             });
         """)
-        page = await context.new_page()
-        return playwright, browser, page
+        # A persistent context starts with a page already open
+        page = context.pages[0] if context.pages else await context.new_page()
+        return playwright, context, page
     except PlaywrightError as e:
         logger.error(f"Failed to initialize browser: {str(e)}")
         raise
@@ -103,17 +410,15 @@ async def search_google_maps(page, location, rate_limiter):
         # Set a longer navigation timeout
         page.set_default_navigation_timeout(6000)  # 60 seconds
 
-        await page.goto("https://www.google.com/maps")
-
-        # Wait for the search box to be available
-        await page.wait_for_selector("input[id='searchboxinput']", timeout=3000)
-
-        search_box = page.locator("input[id='searchboxinput']")
         search_query = f"top hospitals in {location}"
         logger.info(f"Searching for: {search_query}")
 
-        await search_box.fill(search_query)
-        await search_box.press("Enter")
+        # Open the search results directly instead of loading the Maps home page
+        # and typing into the search box
+        await page.goto(
+            f"https://www.google.com/maps/search/{quote_plus(search_query)}",
+            wait_until="domcontentloaded"
+        )
 
         # Wait for results to appear instead of networkidle
         logger.info("Waiting for search results...")
@@ -137,8 +442,11 @@ async def search_google_location(page, location, rate_limiter):
         # Use domcontentloaded instead of networkidle
         await page.goto(location, wait_until="domcontentloaded")
 
-        # Wait for a reasonable amount of time for content to load
-        await asyncio.sleep(3)
+        # Wait for the place panel's heading instead of a fixed delay
+        try:
+            await page.wait_for_selector("div[role='main'] h1", state="attached", timeout=PAGE_LOAD_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.warning(f"Place panel did not load for {location}, continuing anyway")
 
     except PlaywrightTimeoutError as e:
         logger.error(f"Timeout when opening hospital URL: {str(e)}")
@@ -156,76 +464,59 @@ async def get_hospital_list(page, rate_limiter, max_hospitals=10):
 
         # Scroll to load more results - more aggressively
         logger.info("Scrolling to load more hospital results...")
+        count = await page.locator("div[class*='Nv2PK']").count()
         for i in range(5):  # Increased from 3 to 5 scrolls
-            logger.info(f"Scroll {i+1}/5")
-            # More dramatic scrolling
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(random.uniform(2.0, 3.0))  # Longer wait between scrolls
+            # Stop once enough results are loaded
+            if count >= max_hospitals:
+                logger.info(f"Found {count} hospital listings already, stopping scrolling")
+                break
 
-            # Try to find scrollable container and scroll it too
+            logger.info(f"Scroll {i+1}/5")
+            # Scroll the page and the results feed in one round-trip
             try:
-                await page.evaluate("""
-                    const scrollableContainers = Array.from(document.querySelectorAll('div[role="feed"], div[jsaction*="scroll"]'));
-                    if (scrollableContainers.length > 0) {
-                        scrollableContainers.forEach(container => {
-                            container.scrollTop = container.scrollHeight;
-                        });
-                    }
-                """)
-            except:
+                await page.evaluate(RESULTS_SCROLL_JS)
+            except PlaywrightError:
                 pass
 
-        # Get hospital listings
-        hospital_elements =  page.locator("div[class*='Nv2PK']")
-        count = await hospital_elements.count()
-        logger.info(f"Found {count} hospital listings")
-
-        for i in range(min(count, max_hospitals)):
+            # Wait for the scroll to load more listings; stop if none arrive
             try:
-                element = await hospital_elements.nth(i).element_handle()
-
-                name_element = await element.query_selector("div.qBF1Pd")
-                if not name_element:
-                    continue
-
-                hospital_name = await name_element.inner_text()
-
-                href_element = await element.query_selector("a.hfpxzc")
-                if not href_element:
-                    continue
-
-                hospital_href = await href_element.get_attribute("href")
-
-                address_element = await element.query_selector("div.W4Efsd:nth-child(1)")  # More specific selector for address
-                hospital_address = ""
-                if address_element:
-                    address_text = await address_element.inner_text()
-                    # Split by newlines and get the second line which contains the actual address
-                    address_lines = address_text.split('\n')
-                    if len(address_lines) >= 2:
-                        # Take the second line which contains the actual address
-                        hospital_address = address_lines[1].strip()
-                    elif address_lines:
-                        # If there's only one line, try to remove common hospital type prefixes
-                        address = address_lines[0].strip()
-                        # Remove common hospital type prefixes
-                        prefixes_to_remove = ["General hospital", "Private hospital", "University hospital", "State hospital"]
-                        for prefix in prefixes_to_remove:
-                            if address.lower().startswith(prefix.lower()):
-                                address = address[len(prefix):].strip()
-                        hospital_address = address
-
-                if hospital_name and hospital_href:
-                    hospital_info = {
-                        'name': hospital_name,
-                        'address': hospital_address,
-                        'href': hospital_href
-                    }
-                    hospitals.append(hospital_info)
-                    logger.info(f"Added hospital: {hospital_name}")
-            except PlaywrightError as e:
-                logger.warning(f"Error getting hospital info: {str(e)}")
-                continue
+                await page.wait_for_function(
+                    "(prev) => document.querySelectorAll(\"div[class*='Nv2PK']\").length > prev",
+                    arg=count,
+                    timeout=SCROLL_WAIT_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                logger.info(f"Hospital listings stopped growing at {count}, stopping scrolling")
+                break
+            count = await page.locator("div[class*='Nv2PK']").count()
+
+        # Read every listing's name, place URL and address text in one round-trip
+        listings = await page.locator("div[class*='Nv2PK']").evaluate_all(EXTRACT_HOSPITALS_JS)
+        logger.info(f"Found {len(listings)} hospital listings")
+
+        for listing in listings[:max_hospitals]:
+            hospital_name = listing['name']
+            hospital_href = listing['href']
+
+            hospital_address = ""
+            address_text = listing['addressText']
+            if address_text:
+                _, sep, rest = address_text.partition('\n')
+                if sep:
+                    # Take the second line which contains the actual address
+                    hospital_address = rest.partition('\n')[0].strip()
+                else:
+                    # If there's only one line, remove the hospital type prefix
+                    hospital_address = _ADDR_PREFIX_RE.sub('', address_text.strip())
+
+            if hospital_name and hospital_href:
+                hospital_info = {
+                    'name': hospital_name,
+                    'address': hospital_address,
+                    'href': hospital_href
+                }
+                hospitals.append(hospital_info)
+                logger.info(f"Added hospital: {hospital_name}")
 
     except PlaywrightTimeoutError as e:
         logger.error(f"Timeout getting hospital list: {str(e)}")
@@ -234,12 +525,126 @@ async def get_hospital_list(page, rate_limiter, max_hospitals=10):
 
     return hospitals
 
+def parse_star_rating(value):
+    """Format a numeric star rating, rejecting anything outside 1-5"""
+    if type(value) is not int or not 1 <= value <= 5:
+        raise ValueError(f"unexpected rating {value!r}")
+    return f"{value} stars"
+
+def parse_http_review(hospital_name, index, raw):
+    """Build a Review from one endpoint entry, raising ValueError on an unexpected shape"""
+    reviewer, text = raw[0][1], raw[3]
+    if not isinstance(reviewer, (str, type(None))) or not isinstance(text, (str, type(None))):
+        raise ValueError(f"unexpected reviewer {reviewer!r} or text {text!r}")
+    return Review(
+        hospital=hospital_name,
+        reviewer=clean_text(reviewer or f"Anonymous Reviewer {index+1}"),
+        rating=parse_star_rating(raw[4]),
+        text=clean_text(text or "")
+    )
+
 def clean_text(text):
-    # Remove emojis
-    text = emoji.replace_emoji(text, replace='')
+    # Remove emojis; pure ASCII text can't contain any, so skip the scan
+    if not text.isascii():
+        text = emoji.replace_emoji(text, replace='')
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return _WS_RE.sub(' ', text).strip()
+
+async def fetch_reviews_http(endpoint, hospital, rate_limiter, validator, max_reviews=60):
+    """Fetch reviews from the Maps JSON endpoint, returning None if it can't be used"""
+    if not endpoint.enabled:
+        return None
+
+    match = _PLACE_ID_RE.search(hospital['href'])
+    if not match:
+        logger.info(f"No place id in URL for {hospital['name']}, using the browser")
+        return None
+
+    # The endpoint is undocumented: the pb request string and the reviewer
+    # (raw[0][1]), text (raw[3]) and rating (raw[4]) indices read by
+    # parse_http_review() are taken from the requests the Maps UI makes and
+    # haven't been verified against a live response. Any mismatch disables this
+    # path in favour of the browser.
+    entity_a, entity_b = (int(part, 16) for part in match.groups())
+    params = {
+        "authuser": "0",
+        "hl": "en",
+        "pb": f"!1m2!1y{entity_a}!2y{entity_b}!2m2!1i0!2i{max_reviews}!3e1!4m5!3b1!4b1!5b1!6b1!7b1!5m2!1s!7e81"
+    }
+
+    try:
+        await rate_limiter.wait()
+        response = await endpoint.client.get(REVIEWS_ENDPOINT, params=params)
+        if response.status_code != HTTPStatus.OK:
+            endpoint.disable(f"Reviews endpoint returned {response.status_code} for {hospital['name']}")
+            return None
+
+        # The body starts with the ")]}'" anti-XSSI line
+        body = response.content
+        data = orjson.loads(body[body.index(b'\n') + 1:])
+        raw_reviews = data[2]
+        if not raw_reviews:
+            logger.info(f"Reviews endpoint returned no reviews for {hospital['name']}")
+            return None
+
+        # Parse everything before validating so a format change doesn't mark reviews as seen
+        parsed = [
+            parse_http_review(hospital['name'], i, raw)
+            for i, raw in enumerate(raw_reviews[:max_reviews])
+        ]
+    except httpx.HTTPError as e:
+        logger.warning(f"Error fetching reviews for {hospital['name']}: {str(e)}")
+        return None
+    except (ValueError, LookupError, TypeError) as e:
+        # LookupError covers a payload that is a JSON object rather than a list
+        endpoint.disable(f"Unexpected reviews payload for {hospital['name']}: {str(e)}")
+        return None
+
+    reviews = []
+    for review_data in parsed:
+        validated_review = validator.validate_review(review_data)
+        if validated_review:
+            reviews.append(validated_review)
+
+    logger.info(f"Fetched {len(reviews)} valid reviews for {hospital['name']} over HTTP")
+    return reviews
+
+async def find_review_selector(page):
+    """Return the first review element selector that matches on the page"""
+    try:
+        match = await page.evaluate(FIND_FIRST_SELECTOR_JS, list(REVIEW_ELEMENT_SELECTORS))
+    except PlaywrightError:
+        return None
+    if not match:
+        return None
+
+    selector, count = match
+    logger.info(f"Found {count} review elements with selector: {selector}")
+    return selector
+
+async def start_review_harvester(page, selector):
+    """Start collecting review elements in the page as they load"""
+    await page.evaluate(INSTALL_REVIEW_HARVESTER_JS, {
+        "selector": selector,
+        "reviewerSelectors": REVIEWER_SELECTORS,
+        "ratingSelectors": RATING_SELECTORS,
+        "textSelectors": REVIEW_TEXT_SELECTORS
+    })
+    await wait_for_reviews_ready(page)
+
+async def wait_for_reviews_ready(page):
+    """Wait until queued reviews have finished expanding"""
+    try:
+        await page.wait_for_function(REVIEWS_READY_JS, timeout=SCROLL_WAIT_TIMEOUT)
+    except PlaywrightTimeoutError:
+        logger.debug("Timed out waiting for reviews to expand")
+
+async def wait_for_review_elements(page):
+    """Wait until any review element is attached to the page"""
+    try:
+        await page.wait_for_selector(ANY_REVIEW_SELECTOR, state="attached", timeout=PAGE_LOAD_TIMEOUT)
+    except PlaywrightTimeoutError:
+        logger.info("No review elements appeared after opening the reviews section")
 
 async def scrape_reviews(page, hospital_name, rate_limiter, validator, max_reviews=60):
     reviews = []
@@ -251,11 +656,16 @@ async def scrape_reviews(page, hospital_name, rate_limiter, validator, max_revie
         # Take a screenshot to see the current state
         # await page.screenshot(path=f"hospital_page_{hospital_name.replace(' ', '_')}.png")
 
-        # First wait for the page to stabilize
-        await asyncio.sleep(3)
+        # First wait for the place tabs to render
+        try:
+            await page.wait_for_selector("[role='tab']", state="attached", timeout=SCROLL_WAIT_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.info("No tabs found on the place page")
 
         # Try multiple approaches to find the reviews section
         found_reviews = False
+        # Review element selector, cached once known so it isn't re-scanned
+        found_selector: Optional[str] = None
 
         # Approach 1: Look for tab with "Reviews" text
         try:
@@ -265,7 +675,7 @@ async def scrape_reviews(page, hospital_name, rate_limiter, validator, max_revie
                 logger.info("Found Reviews tab")
                 await rate_limiter.wait()
                 await review_tab.click()
-                await asyncio.sleep(2)
+                await wait_for_review_elements(page)
                 found_reviews = True
         except PlaywrightError as e:
             logger.warning(f"Could not find Reviews tab: {str(e)}")
@@ -273,44 +683,20 @@ async def scrape_reviews(page, hospital_name, rate_limiter, validator, max_revie
         # Approach 2: Look for elements containing review text
         if not found_reviews:
             logger.info("Looking for review elements directly...")
-            review_selectors = [
-                "div[class*='jJc9Ad']",   # Original selector
-                "div[data-review-id]",    # Elements with review IDs
-                "div[class*='review']",   # Classes containing 'review'
-                "div[class*='rating']",   # Classes containing 'rating'
-                "div[class*='star']"      # Classes containing 'star'
-            ]
-
-            for selector in review_selectors:
-                try:
-                    elements = page.locator(selector)
-                    count = await elements.count()
-                    if count > 0:
-                        logger.info(f"Found {count} review elements with selector: {selector}")
-                        found_reviews = True
-                        break
-                except PlaywrightError:
-                    continue
+            found_selector = await find_review_selector(page)
+            found_reviews = found_selector is not None
 
         # Approach 3: Try to click on any element that might reveal reviews
         if not found_reviews:
             logger.info("Trying to click on elements that might reveal reviews...")
-            potential_review_triggers = [
-                "button:has-text('Reviews')",
-                "button:has-text('Review')",
-                "a:has-text('Reviews')",
-                "div:has-text('Reviews')",
-                "span:has-text('Reviews')"
-            ]
-
-            for selector in potential_review_triggers:
+            for selector in REVIEW_TRIGGER_SELECTORS:
                 try:
                     elements = page.locator(selector)
                     count = await elements.count()
                     if count > 0:
                         logger.info(f"Found potential review trigger: {selector}")
                         await elements.first.click()
-                        await asyncio.sleep(2)
+                        await wait_for_review_elements(page)
                         found_reviews = True
                         break
                 except PlaywrightError:
@@ -321,153 +707,50 @@ async def scrape_reviews(page, hospital_name, rate_limiter, validator, max_revie
             # Take another screenshot to see current state
             await page.screenshot(path=f"no_reviews_found_{hospital_name.replace(' ', '_')}.png")
 
-        # Scroll to load potential reviews, even if we couldn't find a specific tab
+        # Reviews may only render once the panel is scrolled, so until a review
+        # selector matches, scroll blindly, even if we couldn't find a specific tab
         logger.info("Scrolling to find reviews...")
-        for i in range(5):  # Increased from 3 to 5 scrolls
-            logger.info(f"Review scroll {i+1}/5")
-
-            # Try multiple scrolling techniques
-            # 1. Standard mouse wheel
-            await page.mouse.wheel(0, 3000)
-            await asyncio.sleep(1.0)
+        for i in range(MAX_REVIEW_SCROLLS):
+            if not found_selector:
+                found_selector = await find_review_selector(page)
+            if found_selector:
+                break
 
-            # 2. JavaScript scrolling
+            logger.info(f"Review scroll {i+1}/{MAX_REVIEW_SCROLLS}")
             try:
-                # Try to find and scroll the reviews container
-                await page.evaluate("""
-                    // Try to find review containers
-                    const reviewContainers = Array.from(document.querySelectorAll(
-                        'div[role="feed"], div[jsaction*="scroll"], div[data-review-id], div[class*="review"], div[class*="scroll"]'
-                    ));
-
-                    if (reviewContainers.length > 0) {
-                        reviewContainers.forEach(container => {
-                            container.scrollTop = container.scrollHeight;
-                        });
-                    } else {
-                        // If no specific container, scroll the whole page
-                        window.scrollTo(0, document.body.scrollHeight);
-                    }
-                """)
-            except:
-                pass
-
-            # Wait after scrolling
-            await asyncio.sleep(random.uniform(1.5, 2.5))
-
-            # 3. Check if we have enough reviews already, if so we can stop scrolling
-            try:
-                for selector in ["div[class*='jJc9Ad']", "div[class*='review']", "div[data-review-id]"]:
-                    count = await page.locator(selector).count()
-                    if count >= max_reviews:
-                        logger.info(f"Found {count} reviews already, stopping scrolling")
-                        break
-            except:
-                pass
-
-        # Try multiple selectors for finding review elements
-        review_element_selectors = [
-            "div[class*='jJc9Ad']",        # Original selector
-            "div[data-review-id]",         # Elements with review ID
-            "div[class*='review']",        # Classes with 'review'
-            ".review-container",           # Common review container class
-            "div[class*='comment']",       # Comment sections
-            "div:has(span[aria-label*='stars'])" # Elements containing star ratings
-        ]
-
-        review_elements = None
-        used_selector = None
-
-        for selector in review_element_selectors:
-            try:
-                elements = page.locator(selector)
-                count = await elements.count()
-                if count > 0:
-                    logger.info(f"Found {count} review elements with selector: {selector}")
-                    review_elements = elements
-                    used_selector = selector
-                    break
+                await page.evaluate(REVIEW_SCROLL_JS, 3000)
             except PlaywrightError:
-                continue
+                pass
+            await asyncio.sleep(random.uniform(SCROLL_SLEEP_MIN, SCROLL_SLEEP_MAX))
 
-        if not review_elements:
+        if not found_selector:
+            found_selector = await find_review_selector(page)
+        if not found_selector:
             logger.warning("Could not find any review elements")
             return reviews
 
-        count = await review_elements.count()
-        logger.info(f"Found {count} reviews with selector: {used_selector}")
-
-        # Extract reviews using the found selector
-        for i in range(min(count, max_reviews)):
-            try:
-                element = await review_elements.nth(i).element_handle()
-
-                # Try multiple selectors for reviewer name
-                reviewer = None
-                for name_selector in ["div[class*='d4r55']", "div[class*='author']", "span[class*='name']", "div[class*='profile']"]:
-                    try:
-                        name_elem = await element.query_selector(name_selector)
-                        if name_elem:
-                            reviewer = await name_elem.inner_text()
-                            if reviewer:
-                                break
-                    except:
-                        pass
-
-                if not reviewer:
-                    reviewer = f"Anonymous Reviewer {i+1}"
-
-                # Try multiple selectors for rating
-                rating = None
-                for rating_selector in ["span[aria-label*='star']", "span[class*='rating']", "div[class*='star']", "span[aria-label]"]:
-                    try:
-                        rating_elem = await element.query_selector(rating_selector)
-                        if rating_elem:
-                            rating = await rating_elem.get_attribute("aria-label")
-                            if not rating:
-                                rating = await rating_elem.inner_text()
-                            if rating:
-                                break
-                    except:
-                        pass
-
-                if not rating:
-                    rating = "No rating"
-
-                # Try multiple selectors for review text
-                review_text = None
-                for text_selector in ["span[class*='wiI7pd']", "div[class*='review-text']", "div[class*='content']", "span[class*='review']"]:
-                    try:
-                        text_elem = await element.query_selector(text_selector)
-                        if text_elem:
-                            review_text = await text_elem.inner_text()
-                            if review_text:
-                                break
-                    except:
-                        pass
-
-                if not review_text:
-                    try:
-                        # Try to get any text content as a last resort
-                        review_text = await element.inner_text()
-                    except:
-                        review_text = "No review text available"
-
-                review_data = {
-                    "Hospital": hospital_name,
-                    "Reviewer": clean_text(reviewer),
-                    "Rating": rating,
-                    "Review": clean_text(review_text)
-                }
-
-                # Validate the review
-                validated_review = validator.validate_review(review_data)
-                if validated_review:
-                    reviews.append(validated_review)
-
-            except PlaywrightError as e:
-                logger.warning(f"Error extracting review: {str(e)}")
-                continue
+        # Scroll and collect reviews entirely inside the page in one round-trip
+        await start_review_harvester(page, found_selector)
+        extracted = await page.evaluate(SCROLL_AND_COLLECT_REVIEWS_JS, {
+            "distance": 3000,
+            "maxReviews": max_reviews,
+            "maxScrolls": MAX_REVIEW_SCROLLS,
+            "timeout": SCROLL_WAIT_TIMEOUT
+        })
+        logger.info(f"Extracted {len(extracted)} reviews with selector: {found_selector}")
+
+        for i, item in enumerate(extracted):
+            review_data = Review(
+                hospital=hospital_name,
+                reviewer=clean_text(item["reviewer"] or f"Anonymous Reviewer {i+1}"),
+                rating=item["rating"] or "No rating",
+                text=clean_text(item["text"] or "No review text available")
+            )
+
+            # Validate the review
+            validated_review = validator.validate_review(review_data)
+            if validated_review:
+                reviews.append(validated_review)
 
     except PlaywrightTimeoutError as e:
         logger.error(f"Timeout when scraping reviews: {str(e)}")
@@ -501,16 +784,18 @@ def save_reviews_to_csv(reviews, hospital_name, location):
         safe_hospital_name = re.sub(r'[^a-zA-Z0-9]', '_', hospital_name)
         filename = os.path.join(location_dir, f"{safe_hospital_name}_reviews.csv")
 
-        df = pd.DataFrame(reviews)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(REVIEW_FIELDS)
+            writer.writerows(reviews)
         logger.info(f"Reviews saved to {filename}")
     except IOError as e:
         logger.error(f"Error saving reviews to CSV: {str(e)}")
     except Exception as e:
         logger.error(f"Unexpected error saving CSV: {str(e)}")
 
-def save_hospital_list_to_csv(hospitals, location):
-    """Save the list of hospitals to a CSV file"""
+def save_hospital_list_to_jsonl(hospitals, location):
+    """Save the list of hospitals to a JSON Lines file"""
     if not hospitals:
         logger.warning(f"No hospitals to save for {location}")
         return
@@ -521,35 +806,83 @@ def save_hospital_list_to_csv(hospitals, location):
         os.makedirs(location_dir, exist_ok=True)
 
         # Create a filename for the hospital list
-        filename = os.path.join(location_dir, f"hospital_list_{location.replace(' ', '_')}.csv")
-
-        # Add an index column to the data
-        hospital_data = []
-        for i, hospital in enumerate(hospitals, 1):
-            hospital_data.append({
-                'Index': i,
-                'Hospital Name': hospital['name'],
-                'Hospital Address': hospital['address'],
-                'Google Maps URL': hospital['href']
-            })
-
-        df = pd.DataFrame(hospital_data)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        filename = os.path.join(location_dir, f"hospital_list_{location.replace(' ', '_')}.jsonl")
+
+        # Write one row per hospital as it's serialized, with an index column
+        with open(filename, 'wb') as f:
+            for i, hospital in enumerate(hospitals, 1):
+                f.write(orjson.dumps({
+                    'Index': i,
+                    'Hospital Name': hospital['name'],
+                    'Hospital Address': hospital['address'],
+                    'Google Maps URL': hospital['href']
+                }) + b'\n')
         logger.info(f"Hospital list saved to {filename}")
     except IOError as e:
-        logger.error(f"Error saving hospital list to CSV: {str(e)}")
+        logger.error(f"Error saving hospital list to JSONL: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error saving hospital list CSV: {str(e)}")
+        logger.error(f"Unexpected error saving hospital list JSONL: {str(e)}")
+
+async def hospital_worker(context, endpoint, queue, location, rate_limiter, validator):
+    """Scrape hospitals from the queue until it is empty, reusing one page for fallbacks"""
+    page = None
+    try:
+        while True:
+            try:
+                hospital = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                hospital_reviews = await fetch_reviews_http(endpoint, hospital, rate_limiter, validator)
+
+                if hospital_reviews is None:
+                    # Each worker keeps its own page so scrolling/click state doesn't interfere
+                    if page is None:
+                        page = await context.new_page()
+
+                    # Search for the specific hospital
+                    await search_google_location(page, hospital['href'], rate_limiter)
+                    hospital_reviews = await scrape_reviews(page, hospital['name'], rate_limiter, validator)
+
+                # Each hospital is scraped once, so its near-duplicate index can go
+                validator.forget_hospital(hospital['name'])
+
+                # Save reviews for this hospital without blocking the other workers
+                await asyncio.to_thread(save_reviews_to_csv, hospital_reviews, hospital['name'], location)
+
+                # Add a random delay between hospitals
+                await asyncio.sleep(random.uniform(HOSPITAL_DELAY_MIN, HOSPITAL_DELAY_MAX))
+
+            except Exception as e:
+                logger.error(f"Failed to process hospital {hospital['name']}: {str(e)}")
+    finally:
+        if page:
+            await page.close()
 
 async def main():
     location = "Istanbul, Turkey"  # You can change this to any location
     rate_limiter = RateLimiter(min_delay=2.0, max_delay=5.0)
     validator = ReviewValidator()
+    # One pooled client for every worker; the keepalive outlasts the rate limiter's
+    # gaps so the TLS/HTTP2 connection to google.com is reused across hospitals
+    client = httpx.AsyncClient(
+        http2=True,
+        headers={'User-Agent': USER_AGENT, 'Referer': 'https://www.google.com/maps'},
+        cookies={cookie['name']: cookie['value'] for cookie in CONSENT_COOKIES},
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_connections=MAX_PARALLEL_PAGES,
+            max_keepalive_connections=MAX_PARALLEL_PAGES,
+            keepalive_expiry=30.0
+        )
+    )
+    endpoint = ReviewsEndpoint(client)
 
     # Initialize browser
-    playwright = browser = page = None
+    playwright = context = page = None
     try:
-        playwright, browser, page = await initialize_browser()
+        playwright, context, page = await initialize_browser()
 
         # Search for hospitals
         await search_google_maps(page, location, rate_limiter)
@@ -562,34 +895,26 @@ async def main():
             logger.warning(f"No hospitals found in {location}")
             return
 
-        # Save the hospital list to CSV
-        save_hospital_list_to_csv(hospitals, location)
+        # Save the hospital list to JSONL
+        await asyncio.to_thread(save_hospital_list_to_jsonl, hospitals, location)
 
-        # Scrape reviews for each hospital
+        # Scrape reviews with a fixed pool of workers draining a shared queue
+        queue = asyncio.Queue()
         for hospital in hospitals:
-            try:
-                # Search for the specific hospital
-                await search_google_location(page, hospital['href'], rate_limiter)
-                hospital_reviews = await scrape_reviews(page, hospital['name'], rate_limiter, validator)
-
-                # Save reviews for this hospital
-                save_reviews_to_csv(hospital_reviews, hospital['name'], location)
-
-                # Add a random delay between hospitals
-                await asyncio.sleep(random.uniform(3.0, 7.0))
-
-            except Exception as e:
-                logger.error(f"Failed to process hospital {hospital['name']}: {str(e)}")
-                continue
+            queue.put_nowait(hospital)
+        workers = [
+            hospital_worker(context, endpoint, queue, location, rate_limiter, validator)
+            for _ in range(min(MAX_PARALLEL_PAGES, len(hospitals)))
+        ]
+        await asyncio.gather(*workers)
 
     except Exception as e:
         logger.error(f"Unhandled exception in main: {str(e)}")
     finally:
         # Cleanup
-        if page:
-            await page.wait_for_timeout(2000)
-        if browser:
-            await browser.close()
+        await client.aclose()
+        if context:
+            await context.close()
         if playwright:
             await playwright.stop()
 